@@ -4,6 +4,28 @@ from ansible.parsing.dataloader import DataLoader  # pylint: disable=import-erro
 from ansible.vars.manager import VariableManager  # pylint: disable=import-error
 from ansible.template import Templar  # pylint: disable=import-error
 
+# Keys inserted by Ansible or used to configure schema enforcer, removed from the variables to validate
+KEYS_CLEANUP = frozenset(
+    [
+        "inventory_file",
+        "inventory_dir",
+        "inventory_hostname",
+        "inventory_hostname_short",
+        "group_names",
+        "ansible_facts",
+        "playbook_dir",
+        "ansible_playbook_python",
+        "groups",
+        "omit",
+        "ansible_version",
+        "ansible_config_file",
+        "schema_enforcer_schema_ids",
+        "schema_enforcer_strict",
+        "schema_enforcer_automap_default",
+        "magic_vars_to_evaluate",
+    ]
+)
+
 
 # Referenced https://github.com/fgiorgetti/qpid-dispatch-tests/ for the below class
 class AnsibleInventory:
@@ -56,11 +78,13 @@ class AnsibleInventory:
         templar = Templar(variables=data, loader=self.loader)
         return templar.template(data, fail_on_undefined=False)
 
-    def get_clean_host_vars(self, host):
+    def get_clean_host_vars(self, host, hostvars=None):
         """Return clean hostvars for a given host, cleaned up of all keys inserted by Templar.
 
         Args:
             host (ansible.inventory.host.Host): The host to retrieve variable data from.
+            hostvars (dict, optional): Variables of the host already rendered by get_host_vars, which are left
+                unchanged. Defaults to rendering them.
 
         Raises:
             TypeError: When "magic_vars_to_evaluate" is declared in an Ansible inventory file and is not of type list,
@@ -69,39 +93,17 @@ class AnsibleInventory:
         Returns:
             dict: clean hostvars
         """
-        keys_cleanup = [
-            "inventory_file",
-            "inventory_dir",
-            "inventory_hostname",
-            "inventory_hostname_short",
-            "group_names",
-            "ansible_facts",
-            "playbook_dir",
-            "ansible_playbook_python",
-            "groups",
-            "omit",
-            "ansible_version",
-            "ansible_config_file",
-            "schema_enforcer_schema_ids",
-            "schema_enforcer_strict",
-            "schema_enforcer_automap_default",
-            "magic_vars_to_evaluate",
-        ]
-
-        hostvars = self.get_host_vars(host)
+        if hostvars is None:
+            hostvars = self.get_host_vars(host)
 
         # Extract magic vars which should be evaluated
         magic_vars_to_evaluate = hostvars.get("magic_vars_to_evaluate", [])
         if not isinstance(magic_vars_to_evaluate, list):
             raise TypeError(f"magic_vars_to_evaluate variable configured for host {host.name} must be of type list")
 
-        keys_cleanup = list(set(keys_cleanup) - set(magic_vars_to_evaluate))
-
-        for key in keys_cleanup:
-            if key in hostvars:
-                del hostvars[key]
+        keys_cleanup = KEYS_CLEANUP.difference(magic_vars_to_evaluate)
 
-        return hostvars
+        return {key: value for key, value in hostvars.items() if key not in keys_cleanup}
 
     @staticmethod
     def get_applicable_schemas(hostvars, smgr, declared_schema_ids, automap):
@@ -124,22 +126,23 @@ class AnsibleInventory:
             applicable_schemas (dict): dictionary mapping schema_id to schema obj for all applicable schemas
         """
         applicable_schemas = {}
-        for key in hostvars.keys():
-            # extract applicable schema ID to JsonSchema objects if schema_ids are declared
-            if declared_schema_ids:
-                for schema_id in declared_schema_ids:
+        if not hostvars:
+            return applicable_schemas
+
+        # extract applicable schema ID to JsonSchema objects if schema_ids are declared
+        if declared_schema_ids:
+            for schema_id in declared_schema_ids:
+                applicable_schemas[schema_id] = smgr.schemas[schema_id]
+
+        # extract applicable schema ID to JsonSchema objects based on host var to top level property mapping.
+        elif automap:
+            for key in hostvars:
+                for schema_id in smgr.get_schema_ids_by_property(key):
                     applicable_schemas[schema_id] = smgr.schemas[schema_id]
 
-            # extract applicable schema ID to JsonSchema objects based on host var to top level property mapping.
-            elif automap:
-                for schema in smgr.schemas.values():
-                    if key in schema.top_level_properties:
-                        applicable_schemas[schema.id] = schema
-                        continue
-
         return applicable_schemas
 
-    def get_schema_validation_settings(self, host):
+    def get_schema_validation_settings(self, host, hostvars=None):
         """Parse Ansible Schema Validation Settings from a host object.
 
         Validate settings or ensure an error is raised in the event an invalid parameter is
@@ -147,6 +150,8 @@ class AnsibleInventory:
 
         Args:
             host (AnsibleInventory.host): Ansible Inventory Host Object
+            hostvars (dict, optional): Variables of the host already rendered by get_host_vars.
+                Defaults to rendering them.
 
         Raises:
             TypeError: Raised when one of the schema configuration parameters is of the wrong type
@@ -156,7 +161,8 @@ class AnsibleInventory:
             (dict): Dict of validation settings with keys "declared_schema_ids", "strict", and "automap"
         """
         # Generate host_var and automatically remove all keys inserted by ansible
-        hostvars = self.get_host_vars(host)
+        if hostvars is None:
+            hostvars = self.get_host_vars(host)
 
         # Extract declared_schema_ids from hostvar setting
         declared_schema_ids = []
@@ -214,11 +220,12 @@ class AnsibleInventory:
             if limit and host.name != limit:
                 continue
 
-            # Get hostvars
-            hostvars = self.get_clean_host_vars(host)
+            # Render hostvars once, both the settings and the cleaned up variables are read from them
+            rendered_hostvars = self.get_host_vars(host)
+            hostvars = self.get_clean_host_vars(host, rendered_hostvars)
 
             # Acquire validation settings for the given host
-            schema_validation_settings = self.get_schema_validation_settings(host)
+            schema_validation_settings = self.get_schema_validation_settings(host, rendered_hostvars)
             declared_schema_ids = schema_validation_settings["declared_schema_ids"]
             automap = schema_validation_settings["automap"]
 
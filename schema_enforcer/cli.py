@@ -1,14 +1,16 @@
 """main cli commands."""
+import itertools
+import os
 import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 import click
 from termcolor import colored
 
 from schema_enforcer.utils import MutuallyExclusiveOption
 from schema_enforcer import config
-from schema_enforcer.schemas.manager import SchemaManager
-from schema_enforcer.instances.file import InstanceFileManager
-from schema_enforcer.utils import error
+from schema_enforcer.utils import error, get_data_digest
 from schema_enforcer.exceptions import InvalidJSONSchema
 
 
@@ -38,8 +40,16 @@ def main():
     is_flag=True,
     show_default=True,
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    type=click.IntRange(min=0),
+    help="Number of processes used to validate structured data files, 0 to use one per CPU",
+    show_default=True,
+)
 @main.command()
-def validate(show_pass, show_checks, strict):  # noqa D205
+def validate(show_pass, show_checks, strict, jobs):  # noqa D205
     """Validates instance files against defined schema.
 
     \f
@@ -48,7 +58,12 @@ def validate(show_pass, show_checks, strict):  # noqa D205
         show_pass (bool): show successful schema validations
         show_checks (bool): show schemas which will be validated against each instance file
         strict (bool): Forces a stricter schema check that warns about unexpected additional properties
+        jobs (int): Number of processes used to validate instance files, 0 to use one per CPU
     """
+    # Schema and instance file management pull in heavy dependencies, they are only imported by commands using them
+    from schema_enforcer.schemas.manager import SchemaManager  # pylint: disable=import-outside-toplevel
+    from schema_enforcer.instances.file import InstanceFileManager  # pylint: disable=import-outside-toplevel
+
     config.load()
 
     # ---------------------------------------------------------------------
@@ -81,18 +96,19 @@ def validate(show_pass, show_checks, strict):  # noqa D205
         sys.exit(0)
 
     error_exists = False
-    for instance in ifm.instances:
-        for result in instance.validate(smgr, strict):
+    for instance, results in _iter_instance_results(ifm.instances, smgr, strict, jobs):
+        for result in results:
 
             result.instance_type = "FILE"
             result.instance_name = instance.filename
             result.instance_location = instance.path
 
-            if not result.passed():
+            passed = result.passed()
+            if not passed:
                 error_exists = True
                 result.print()
 
-            elif result.passed() and show_pass:
+            elif show_pass:
                 result.print()
 
     if not error_exists:
@@ -101,6 +117,61 @@ def validate(show_pass, show_checks, strict):  # noqa D205
         sys.exit(1)
 
 
+# SchemaManager of a worker process started by _iter_instance_results, loaded by _init_worker
+_WORKER_SMGR = None
+
+
+def _init_worker(settings):
+    """Load the schemas once per worker process.
+
+    Args:
+        settings (Settings): Settings of the parent process, used to locate the schemas.
+    """
+    from schema_enforcer.schemas.manager import SchemaManager  # pylint: disable=import-outside-toplevel
+
+    global _WORKER_SMGR  # pylint: disable=global-statement
+    _WORKER_SMGR = SchemaManager(config=settings)
+
+
+def _validate_instance(instance, strict):
+    """Validate an instance file against the schemas of the worker process.
+
+    Args:
+        instance (InstanceFile): Instance file to validate.
+        strict (bool): Forces a stricter schema check that warns about unexpected additional properties
+
+    Returns:
+        list: ValidationResult objects for this instance file.
+    """
+    return list(instance.validate(_WORKER_SMGR, strict))
+
+
+def _iter_instance_results(instances, smgr, strict, jobs):
+    """Validate instance files, in parallel across worker processes if more than one job is requested.
+
+    Results are always returned in the order of the instance files.
+
+    Args:
+        instances (list): InstanceFile objects to validate.
+        smgr (SchemaManager): Schema manager used when validating in the current process.
+        strict (bool): Forces a stricter schema check that warns about unexpected additional properties
+        jobs (int): Number of processes to use, 0 to use one per CPU
+
+    Yields:
+        tuple: InstanceFile object and an iterator of its ValidationResult objects.
+    """
+    if jobs == 1 or len(instances) == 1:
+        for instance in instances:
+            yield instance, instance.validate(smgr, strict)
+        return
+
+    workers = jobs or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config.SETTINGS,)) as executor:
+        chunksize = max(1, len(instances) // (workers * 4))
+        results = executor.map(_validate_instance, instances, itertools.repeat(strict), chunksize=chunksize)
+        yield from zip(instances, results)
+
+
 @click.option(
     "--list",
     "list_schemas",
@@ -157,6 +228,8 @@ def schema(check, generate_invalid, list_schemas, schema_id, dump_schemas):  # n
         )
         sys.exit(1)
 
+    from schema_enforcer.schemas.manager import SchemaManager  # pylint: disable=import-outside-toplevel
+
     config.load()
 
     # ---------------------------------------------------------------------
@@ -202,8 +275,16 @@ def schema(check, generate_invalid, list_schemas, schema_id, dump_schemas):  # n
     is_flag=True,
     show_default=True,
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    type=click.IntRange(min=0),
+    help="Number of processes used to validate hosts, 0 to use one per CPU",
+    show_default=True,
+)
 def ansible(
-    inventory, limit, show_pass, show_checks
+    inventory, limit, show_pass, show_checks, jobs
 ):  # pylint: disable=too-many-branches,too-many-locals,too-many-locals,too-many-statements  # noqa: D417,D301
     """Validate the hostvars for all hosts within an Ansible inventory.
 
@@ -220,6 +301,7 @@ def ansible(
         limit (string, None): Name of a host to limit the execution to.
         show_pass (bool): Shows validation checks that pass. Defaults to False.
         show_checks (bool): Shows the schema ids each host will be evaluated against.
+        jobs (int): Number of processes used to validate hosts, 0 to use one per CPU
 
     Example:
         $ cd examples/ansible
@@ -253,6 +335,8 @@ def ansible(
         )
         sys.exit(1)
 
+    from schema_enforcer.schemas.manager import SchemaManager  # pylint: disable=import-outside-toplevel
+
     if inventory:
         config.load(config_data={"ansible_inventory": inventory})
     else:
@@ -285,31 +369,103 @@ def ansible(
         sys.exit(0)
 
     error_exists = False
+    hosts_to_validate = _iter_hosts_to_validate(inv, hosts, limit, smgr)
+    for host_name, results in _iter_host_results(hosts_to_validate, smgr, jobs):
+        for result in results:
+            result.instance_type = "HOST"
+            result.instance_hostname = host_name
+
+            passed = result.passed()
+            if not passed:
+                error_exists = True
+                result.print()
+
+            elif show_pass:
+                result.print()
+
+    if not error_exists:
+        print(colored("ALL SCHEMA VALIDATION CHECKS PASSED", "green"))
+    else:
+        sys.exit(1)
+
+
+# Maximum number of validation results kept by the ansible command to be reused across hosts
+RESULTS_CACHE_SIZE = 10000
+
+# Validation results reused across the hosts validated by a worker process started by _iter_host_results
+_WORKER_RESULTS_CACHE = OrderedDict()
+
+
+def _iter_hosts_to_validate(inv, hosts, limit, smgr):
+    """Render the variables of each host and find the schemas they should be validated against.
+
+    Args:
+        inv (AnsibleInventory): Ansible inventory the hosts belong to.
+        hosts (list): ansible.inventory.host.Host objects to validate.
+        limit (str): Name of a host to limit the execution to.
+        smgr (SchemaManager): Schema manager which handles schema objects.
+
+    Yields:
+        tuple: Name of the host, its clean hostvars, the IDs of its applicable schemas and whether to validate strictly.
+    """
+    # Hosts declaring the same schema IDs, or defining the same top level keys, share the same applicable schemas
+    applicable_schemas_cache = {}
 
     for host in hosts:
         if limit and host.name != limit:
             continue
 
-        # Acquire Host Variables
-        hostvars = inv.get_clean_host_vars(host)
+        # Acquire Host Variables, rendered once for both the settings and the variables to validate
+        rendered_hostvars = inv.get_host_vars(host)
+        hostvars = inv.get_clean_host_vars(host, rendered_hostvars)
 
         # Acquire validation settings for the given host
-        schema_validation_settings = inv.get_schema_validation_settings(host)
+        schema_validation_settings = inv.get_schema_validation_settings(host, rendered_hostvars)
         declared_schema_ids = schema_validation_settings["declared_schema_ids"]
         strict = schema_validation_settings["strict"]
         automap = schema_validation_settings["automap"]
 
-        # Validate declared schemas exist
-        smgr.validate_schemas_exist(declared_schema_ids)
-
         # Acquire schemas applicable to the given host
-        applicable_schemas = inv.get_applicable_schemas(hostvars, smgr, declared_schema_ids, automap)
-        for schema_obj in applicable_schemas.values():
+        if declared_schema_ids:
+            mapping_key = (tuple(declared_schema_ids), bool(hostvars))
+        else:
+            mapping_key = (automap, tuple(hostvars))
+
+        schema_ids = applicable_schemas_cache.get(mapping_key)
+        if schema_ids is None:
+            # Validate declared schemas exist
+            smgr.validate_schemas_exist(declared_schema_ids)
+            schema_ids = tuple(inv.get_applicable_schemas(hostvars, smgr, declared_schema_ids, automap))
+            applicable_schemas_cache[mapping_key] = schema_ids
+
+        yield host.name, hostvars, schema_ids, strict
+
+
+def _validate_host(hostvars, schema_ids, strict, smgr, cache):  # pylint: disable=too-many-arguments
+    """Validate the variables of a host against its applicable schemas.
+
+    Args:
+        hostvars (dict): Clean hostvars of the host.
+        schema_ids (tuple): IDs of the schemas applicable to the host.
+        strict (bool): Forces a stricter schema check that warns about unexpected additional properties
+        smgr (SchemaManager): Schema manager which handles schema objects.
+        cache (OrderedDict): Results of previous validations, least recently used first.
+
+    Returns:
+        list: ValidationResult objects for this host.
+    """
+    results = []
+
+    # Schemas sharing the same top level properties are given the same data, built and hashed once per host
+    payloads = {}
+    for schema_id in schema_ids:
+        schema_obj = smgr.schemas[schema_id]
+        properties = None if strict else tuple(schema_obj.top_level_properties)
+        payload = payloads.get(properties)
+        if payload is None:
             # Combine host attributes into a single data structure matching to properties defined at the top level of the schema definition
             if not strict:
-                data = {}
-                for var in schema_obj.top_level_properties:
-                    data.update({var: hostvars.get(var)})
+                data = {var: hostvars.get(var) for var in properties}
 
             # If the schema_enforcer_strict bool is set, hostvars should match a single schema exactly.
             # Thus, we want to pass the entirety of the cleaned host vars into the validate method rather
@@ -317,22 +473,91 @@ def ansible(
             else:
                 data = hostvars
 
-            # Validate host vars against schema
-            schema_obj.validate(data=data, strict=strict)
+            payload = payloads[properties] = (data, get_data_digest(data))
 
-            for result in schema_obj.get_results():
-                result.instance_type = "HOST"
-                result.instance_hostname = host.name
+        # Validate host vars against schema
+        data, digest = payload
+        results.extend(_validate_host_data(schema_obj, data, digest, strict, cache))
 
-                if not result.passed():
-                    error_exists = True
-                    result.print()
+    return results
 
-                elif result.passed() and show_pass:
-                    result.print()
-            schema_obj.clear_results()
 
-    if not error_exists:
-        print(colored("ALL SCHEMA VALIDATION CHECKS PASSED", "green"))
+def _validate_worker_host(host_to_validate):
+    """Validate the variables of a host against the schemas of the worker process.
+
+    Args:
+        host_to_validate (tuple): Clean hostvars, applicable schema IDs and strict setting of the host.
+
+    Returns:
+        list: ValidationResult objects for this host.
+    """
+    hostvars, schema_ids, strict = host_to_validate
+    return _validate_host(hostvars, schema_ids, strict, _WORKER_SMGR, _WORKER_RESULTS_CACHE)
+
+
+def _iter_host_results(hosts_to_validate, smgr, jobs):
+    """Validate hosts, in parallel across worker processes if more than one job is requested.
+
+    Hostvars are rendered in the current process, only their validation runs in the workers.
+    Results are always returned in the order of the hosts.
+
+    Args:
+        hosts_to_validate (iterator): Tuples returned by _iter_hosts_to_validate.
+        smgr (SchemaManager): Schema manager used when validating in the current process.
+        jobs (int): Number of processes to use, 0 to use one per CPU
+
+    Yields:
+        tuple: Name of the host and a list of its ValidationResult objects.
+    """
+    if jobs != 1:
+        hosts_to_validate = list(hosts_to_validate)
+
+    if jobs == 1 or len(hosts_to_validate) <= 1:
+        # With a single job, hosts are rendered as they are validated so results are printed as soon as available.
+        # A single host (e.g. with --host) isn't worth starting worker processes which each load all the schemas.
+        results_cache = OrderedDict()
+        for host_name, hostvars, schema_ids, strict in hosts_to_validate:
+            yield host_name, _validate_host(hostvars, schema_ids, strict, smgr, results_cache)
+        return
+
+    host_names = [host_name for host_name, _, _, _ in hosts_to_validate]
+    tasks = [(hostvars, schema_ids, strict) for _, hostvars, schema_ids, strict in hosts_to_validate]
+
+    workers = jobs or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config.SETTINGS,)) as executor:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        yield from zip(host_names, executor.map(_validate_worker_host, tasks, chunksize=chunksize))
+
+
+def _validate_host_data(schema_obj, data, digest, strict, cache):  # pylint: disable=too-many-arguments
+    """Validate host data against a schema, reusing the results of a previous host which had the same data.
+
+    Only JSONSchema results are reused, custom validators may depend on more than the data they are given.
+
+    Args:
+        schema_obj (BaseValidation): Schema to validate the data against.
+        data (dict): Host variables to validate.
+        digest (bytes): Digest of the data returned by get_data_digest, None if the results can't be reused.
+        strict (bool): Forces a stricter schema check that warns about unexpected additional properties
+        cache (OrderedDict): Results of previous validations, least recently used first.
+
+    Returns:
+        list: ValidationResult objects, which can be updated with the details of the host.
+    """
+    from schema_enforcer.schemas.jsonschema import JsonSchema  # pylint: disable=import-outside-toplevel
+
+    key = None
+    if digest is not None and isinstance(schema_obj, JsonSchema):
+        key = (schema_obj.id, strict, digest)
+
+    results = cache.get(key) if key else None
+    if results is None:
+        results = list(schema_obj.iter_results(data, strict))
+        if key:
+            cache[key] = results
+            if len(cache) > RESULTS_CACHE_SIZE:
+                cache.popitem(last=False)
     else:
-        sys.exit(1)
+        cache.move_to_end(key)
+
+    return [result.copy() for result in results]
@@ -6,10 +6,12 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import toml
-from pydantic import BaseSettings, ValidationError
+from pydantic import BaseSettings, ValidationError, validator
 
 SETTINGS = None
 
+VALIDATION_BACKENDS = ("jsonschema", "fastjsonschema")
+
 
 class Settings(BaseSettings):  # pylint: disable=too-few-public-methods
     """Main Settings Class for the project.
@@ -43,6 +45,9 @@ class Settings(BaseSettings):  # pylint: disable=too-few-public-methods
     ansible_inventory: Optional[str]
     schema_mapping: Dict = {}
 
+    # Library used to validate data against JSONSchema definitions
+    validation_backend: str = "jsonschema"
+
     class Config:  # pylint: disable=too-few-public-methods
         """Additional parameters to automatically map environment variable to some settings."""
 
@@ -51,6 +56,21 @@ class Settings(BaseSettings):  # pylint: disable=too-few-public-methods
             "definition_directory": {"env": "jsonschema_definition_directory"},
         }
 
+    @validator("validation_backend")
+    def validation_backend_must_be_supported(cls, var):  # pylint: disable=no-self-argument, no-self-use
+        """Validate that validation_backend is one of the supported libraries, and that it is installed."""
+        if var not in VALIDATION_BACKENDS:
+            raise ValueError(f"must be one of {', '.join(VALIDATION_BACKENDS)}")
+        if var == "fastjsonschema":
+            try:
+                import fastjsonschema  # noqa: F401 pylint: disable=import-outside-toplevel,unused-import
+            except ModuleNotFoundError as err:
+                raise ValueError(
+                    "fastjsonschema package not found, you can run the command "
+                    "'pip install schema-enforcer[fastjsonschema]' to install it"
+                ) from err
+        return var
+
 
 def load(config_file_name="pyproject.toml", config_data=None):
     """Load configuration.
@@ -36,3 +36,10 @@ class InvalidJSONSchema(Exception):
         errors = [result.message for result in self.schema.check_if_valid() if not result.passed()]
         message = f"Invalid JSONschema file: {self.schema.filename} - {errors}"
         return message
+
+
+class InvalidValidatorPlugin(Exception):
+    """Raised when a custom validator plugin doesn't implement the validator API.
+
+    Args (Exception): Base Exception Object
+    """
@@ -114,7 +114,9 @@ class InstanceFile:
             set(string): Set of matches (strings of schema_ids) found in the file.
         """
         if not content:
-            content = self._get_content(structured=False)
+            # The decorator must be defined on the first line of the file, there is no need to read the whole file
+            with open(os.path.join(self.full_path, self.filename), encoding="utf-8") as fileh:
+                content = fileh.readline()
 
         matches = set()
 
@@ -149,13 +151,8 @@ class InstanceFile:
         Args:
             schema_manager (schema_enforcer.schemas.manager.SchemaManager): Schema manager oject
         """
-        matches = set()
-
-        for schema_id, schema_obj in schema_manager.iter_schemas():
-            if schema_obj.top_level_properties.intersection(self.top_level_properties):
-                matches.add(schema_id)
-
-        self.matches.update(matches)
+        for prop in self.top_level_properties:
+            self.matches.update(schema_manager.get_schema_ids_by_property(prop))
 
     def validate(self, schema_manager, strict=False):
         """Validate this instance file with all matching schema in the schema manager.
@@ -172,12 +169,13 @@ class InstanceFile:
         errs = itertools.chain()
 
         # Go over all schemas and skip any schema not present in the matches
-        for schema_id, schema in schema_manager.iter_schemas():
-            if schema_id not in self.matches:
-                continue
-            schema.validate(self._get_content(), strict)
-            results = schema.get_results()
-            errs = itertools.chain(errs, results)
-            schema.clear_results()
+        schemas = [schema for schema_id, schema in schema_manager.iter_schemas() if schema_id in self.matches]
+        if not schemas:
+            return errs
+
+        # Parse the file once for all schemas, without keeping its content around once validated
+        content = self._get_content()
+        for schema in schemas:
+            errs = itertools.chain(errs, schema.iter_results(content, strict))
 
         return errs
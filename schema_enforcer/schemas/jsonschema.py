@@ -2,14 +2,102 @@
 import copy
 import pkgutil
 import json
+from collections import OrderedDict
 
+import jsonref
 from jsonschema import Draft7Validator, draft7_format_checker  # pylint: disable=import-self
+from jsonschema.exceptions import ValidationError
 from schema_enforcer.schemas.validator import BaseValidation
+from schema_enforcer.utils import get_data_digest
 from schema_enforcer.validation import ValidationResult, RESULT_FAIL, RESULT_PASS
 
 # TODO do we need to catch a possible exception here ?
 v7data = pkgutil.get_data("jsonschema", "schemas/draft7.json")
 v7schema = json.loads(v7data.decode("utf-8"))
+v7validator = Draft7Validator(v7schema, format_checker=draft7_format_checker)
+
+# Compiled validators shared by all JsonSchema objects, keyed by the digest of the schema with its references resolved.
+# A schema loaded again by a new SchemaManager, or an identical schema defined in another file, is only compiled once.
+# The least recently used validators are dropped past VALIDATOR_CACHE_SIZE, e.g. those compiled for edited schemas.
+VALIDATOR_CACHE_SIZE = 1000
+_VALIDATOR_CACHE = OrderedDict()
+
+
+def _resolve_ref(obj):
+    """Serialize JsonRef proxies as the data they reference when computing the digest of a schema."""
+    if isinstance(obj, jsonref.JsonRef):
+        return obj.__subject__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def get_cached_validator(schema, format_checker, backend="jsonschema"):
+    """Return a validator for a schema, reusing the one already compiled for an identical schema if any.
+
+    Args:
+        schema (dict): Data representing the schema.
+        format_checker (FormatChecker): Format checker to use with a jsonschema validator.
+        backend (str, optional): Library used to validate data, "jsonschema" or "fastjsonschema". Defaults to "jsonschema".
+
+    Returns:
+        Draft7Validator, FastJsonSchemaValidator: The validator for this schema.
+    """
+    digest = get_data_digest(schema, default=_resolve_ref)
+    if digest is None:
+        # The schema can't be serialized to JSON (e.g. recursive references), don't try to share its validator
+        return _create_validator(schema, format_checker, backend)
+
+    key = (digest, format_checker, backend)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator = _create_validator(schema, format_checker, backend)
+        _VALIDATOR_CACHE[key] = validator
+        if len(_VALIDATOR_CACHE) > VALIDATOR_CACHE_SIZE:
+            _VALIDATOR_CACHE.popitem(last=False)
+    else:
+        _VALIDATOR_CACHE.move_to_end(key)
+
+    return validator
+
+
+def _create_validator(schema, format_checker, backend):
+    """Compile a new validator for a schema with the given backend."""
+    if backend == "fastjsonschema":
+        return FastJsonSchemaValidator(schema)
+
+    return Draft7Validator(schema, format_checker=format_checker)
+
+
+class FastJsonSchemaValidator:  # pylint: disable=too-few-public-methods
+    """Validator generating Python code for a schema with fastjsonschema.
+
+    fastjsonschema stops at the first error found, so at most one error is reported per validation.
+    """
+
+    def __init__(self, schema):
+        """Compile the validation function for a schema.
+
+        Args:
+            schema (dict): Data representing the schema.
+        """
+        import fastjsonschema  # pylint: disable=import-outside-toplevel
+
+        self.exception = fastjsonschema.JsonSchemaValueException
+        self.validate = fastjsonschema.compile(schema, use_default=False)
+
+    def iter_errors(self, data):
+        """Validate data, yielding errors in the same format as jsonschema validators.
+
+        Args:
+            data (dict, list): Data to validate against the schema.
+
+        Returns:
+            Iterator: Iterator of jsonschema ValidationError.
+        """
+        try:
+            self.validate(data)
+        except self.exception as err:
+            # The first element of the path is the name of the root variable, "data"
+            yield ValidationError(err.message, path=err.path[1:])
 
 
 class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attributes
@@ -17,13 +105,15 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
 
     schematype = "jsonchema"
 
-    def __init__(self, schema, filename, root):
+    def __init__(self, schema, filename, root, backend="jsonschema"):
         """Initilize a new JsonSchema object from a dict.
 
         Args:
             schema (dict): Data representing the schema. Must be jsonschema valid.
             filename (string): Name of the schema file on the filesystem.
             root (string): Absolute path to the directory where the schema file is located.
+            backend (string, optional): Library used to validate data, "jsonschema" or "fastjsonschema".
+                Defaults to "jsonschema".
         """
         super().__init__()
         self.filename = filename
@@ -34,6 +124,7 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
         self.validator = None
         self.strict_validator = None
         self.format_checker = draft7_format_checker
+        self.backend = backend
 
     def get_id(self):
         """Return the unique ID of the schema."""
@@ -46,8 +137,8 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
             data (dict, list): Data to validate against the schema.
             strict (bool, optional): if True the validation will automatically flag additional properties. Defaults to False.
 
-        Returns:
-            Iterator: Iterator of ValidationResult
+        Yields:
+            ValidationResult: a failed result per error, or a single passed result if the data is valid.
         """
         if strict:
             validator = self.__get_strict_validator()
@@ -58,11 +149,10 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
         for err in validator.iter_errors(data):
 
             has_error = True
-            self.add_validation_error(err.message, absolute_path=list(err.absolute_path))
+            yield self.validation_error(err.message, absolute_path=list(err.absolute_path))
 
         if not has_error:
-            self.add_validation_pass()
-        return self.get_results()
+            yield self.validation_pass()
 
     def validate_to_dict(self, data, strict=False):
         """Return a list of ValidationResult objects.
@@ -84,12 +174,12 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
         """Return the validator for this schema, create if it doesn't exist already.
 
         Returns:
-            Draft7Validator: The validator for this schema.
+            Draft7Validator, FastJsonSchemaValidator: The validator for this schema.
         """
         if self.validator:
             return self.validator
 
-        self.validator = Draft7Validator(self.data, format_checker=self.format_checker)
+        self.validator = get_cached_validator(self.data, self.format_checker, self.backend)
 
         return self.validator
 
@@ -99,7 +189,7 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
         To create a strict version of the schema, this function adds `additionalProperties` to all objects in the schema.
 
         Returns:
-            Draft7Validator: Validator for this schema in strict mode.
+            Draft7Validator, FastJsonSchemaValidator: Validator for this schema in strict mode.
         """
         # TODO Currently the function is only modifying the top level object, need to add that to all objects recursively
         if self.strict_validator:
@@ -123,7 +213,7 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
                     )
                 items["additionalProperties"] = False
 
-        self.strict_validator = Draft7Validator(schema, format_checker=self.format_checker)
+        self.strict_validator = get_cached_validator(schema, self.format_checker, self.backend)
         return self.strict_validator
 
     def check_if_valid(self):
@@ -132,11 +222,9 @@ class JsonSchema(BaseValidation):  # pylint: disable=too-many-instance-attribute
         Returns:
             List[ValidationResult]: A list of validation result objects.
         """
-        validator = Draft7Validator(v7schema, format_checker=self.format_checker)
-
         results = []
         has_error = False
-        for err in validator.iter_errors(self.data):
+        for err in v7validator.iter_errors(self.data):
 
             has_error = True
 
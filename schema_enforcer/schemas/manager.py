@@ -48,7 +48,13 @@ class SchemaManager:
         validators = load_validators(config.validator_directory)
         self.schemas.update(validators)
 
-    def create_schema_from_file(self, root, filename):  # pylint: disable=no-self-use
+        # Index schema IDs by top level property, to map data to schemas without going through all schemas
+        self.property_index = {}
+        for schema_id, schema in self.schemas.items():
+            for prop in getattr(schema, "top_level_properties", ()):
+                self.property_index.setdefault(prop, []).append(schema_id)
+
+    def create_schema_from_file(self, root, filename):
         """Create a new JsonSchema object for a given file.
 
         Load the content from disk and resolve all JSONRef within the schema file.
@@ -66,7 +72,7 @@ class SchemaManager:
         # schema_type = "jsonschema"
         base_uri = f"file:{root}/"
         schema_full = jsonref.JsonRef.replace_refs(file_data, base_uri=base_uri, jsonschema=True, loader=load_file)
-        schema = JsonSchema(schema=schema_full, filename=filename, root=root)
+        schema = JsonSchema(schema=schema_full, filename=filename, root=root, backend=self.config.validation_backend)
         # Only add valid jsonschema files and raise an exception if an invalid file is found
         valid = all((result.passed() for result in schema.check_if_valid()))
         if not valid:
@@ -81,6 +87,17 @@ class SchemaManager:
         """
         return self.schemas.items()
 
+    def get_schema_ids_by_property(self, prop):
+        """Return the IDs of all schemas defining a given top level property.
+
+        Args:
+            prop (str): Name of a top level property.
+
+        Returns:
+            list: Schema IDs, in the order in which the schemas were loaded.
+        """
+        return self.property_index.get(prop, [])
+
     def print_schemas_list(self):
         """Print the list of all schemas to the cli.
 
@@ -167,7 +184,7 @@ class SchemaManager:
 
             test_data = load_file(os.path.join(root, filename))
 
-            for result in schema.validate(test_data, strict=strict):
+            for result in schema.iter_results(test_data, strict):
                 result.instance_name = filename
                 result.instance_location = root
                 result.instance_type = "TEST"
@@ -202,7 +219,6 @@ class SchemaManager:
 
         results = []
         for test_dir in test_dirs:
-            schema.clear_results()
             data_file_path = os.path.join(invalid_test_dir, test_dir, "data")
             data_file = find_file(data_file_path)
             expected_results_file_path = os.path.join(invalid_test_dir, test_dir, "results")
@@ -260,7 +276,6 @@ class SchemaManager:
 
         # For each test, load the data file, test the data against the schema and save the results
         for test_dir in test_dirs:
-            schema.clear_results()
             data_file_path = os.path.join(invalid_test_dir, test_dir, "data")
             data_file = find_file(data_file_path)
 
@@ -2,58 +2,110 @@
 # pylint: disable=no-member, too-few-public-methods
 # See PEP585 (https://www.python.org/dev/peps/pep-0585/)
 from __future__ import annotations
+import importlib.util
+import operator
+import os
 import pkgutil
 import inspect
-import jmespath
+import sys
+from typing import Iterator
+from schema_enforcer.exceptions import InvalidValidatorPlugin
 from schema_enforcer.validation import ValidationResult
 
+# Validator API removed in favour of yielding results from validate, see docs/custom_validators.md
+_REMOVED_METHODS = {
+    "add_validation_error": "yield self.validation_error(...)",
+    "add_validation_pass": "yield self.validation_pass(...)",
+    "get_results": "iter_results(data, strict)",
+    "clear_results": "iter_results(data, strict)",
+}
+
+# Comparison functions supported by JmesPathModelValidation, called as function(lhs, rhs)
+_OPERATORS = {
+    "eq": operator.eq,
+    "contains": operator.contains,
+}
+
+# Numeric comparisons supported by JmesPathModelValidation, operands are converted to int unless they already are
+_INT_OPERATORS = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
 
 class BaseValidation:
     """Base class for Validation classes."""
 
-    def __init__(self):
-        """Base init for all validation classes."""
-        self._results: list[ValidationResult] = []
+    # Validators keep no state per instance, plugins declaring __slots__ too are created without a __dict__
+    __slots__ = ()
 
-    def add_validation_error(self, message: str, **kwargs):
-        """Add validator error to results.
+    def validation_error(self, message: str, **kwargs) -> ValidationResult:
+        """Create a validator error, to be yielded by validate.
 
         Args:
           message (str): error message
           kwargs (optional): additional arguments to add to ValidationResult when required
         """
-        self._results.append(ValidationResult(result="FAIL", schema_id=self.id, message=message, **kwargs))
+        return ValidationResult(result="FAIL", schema_id=self.id, message=message, **kwargs)
 
-    def add_validation_pass(self, **kwargs):
-        """Add validator pass to results.
+    def validation_pass(self, **kwargs) -> ValidationResult:
+        """Create a validator pass, to be yielded by validate.
 
         Args:
           kwargs (optional): additional arguments to add to ValidationResult when required
         """
-        self._results.append(ValidationResult(result="PASS", schema_id=self.id, **kwargs))
+        return ValidationResult(result="PASS", schema_id=self.id, **kwargs)
 
-    def get_results(self) -> list[ValidationResult]:
-        """Return all validation results for this validator."""
-        if not self._results:
-            self._results.append(ValidationResult(result="PASS", schema_id=self.id))
+    def iter_results(self, data: dict, strict: bool) -> Iterator[ValidationResult]:
+        """Validate data, reporting a pass when validate yields no result.
 
-        return self._results
+        Args:
+          data (dict): variables to be validated by validator
+          strict (bool): true when --strict cli option is used to request strict validation (if provided)
 
-    def clear_results(self):
-        """Reset results for validator instance."""
-        self._results = []
+        Yields:
+          ValidationResult: results yielded by validate, or a single pass if there are none.
 
-    def validate(self, data: dict, strict: bool):
+        Raises:
+          InvalidValidatorPlugin: validate returned something else than an iterable of results, e.g. None.
+        """
+        results = self.validate(data, strict)
+        try:
+            results = iter(results)
+        except TypeError:
+            raise InvalidValidatorPlugin(
+                f"Validator {type(self).__name__} returned {type(results).__name__} from validate instead of yielding "
+                "its results, see docs/custom_validators.md"
+            ) from None
+
+        has_result = False
+        for result in results:
+            has_result = True
+            yield result
+
+        if not has_result:
+            yield self.validation_pass()
+
+    def __getattr__(self, name):
+        """Point plugins still using the removed validator API to its replacement."""
+        if name in _REMOVED_METHODS:
+            raise InvalidValidatorPlugin(
+                f"Validator {type(self).__name__} uses {name}, which has been removed, use {_REMOVED_METHODS[name]} "
+                "instead, see docs/custom_validators.md"
+            )
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def validate(self, data: dict, strict: bool) -> Iterator[ValidationResult]:
         """Required function for custom validator.
 
         Args:
           data (dict): variables to be validated by validator
           strict (bool): true when --strict cli option is used to request strict validation (if provided)
 
-        Returns:
-          None
-
-        Use add_validation_error and add_validation_pass to report results.
+        Yields:
+          ValidationResult: result of each check, created with validation_error and validation_pass.
         """
         raise NotImplementedError
 
@@ -61,27 +113,50 @@ class BaseValidation:
 class JmesPathModelValidation(BaseValidation):
     """Base class for JmesPathModelValidation classes."""
 
-    def validate(self, data: dict, strict: bool):  # pylint: disable=W0613
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Compile the jmespath expression of the left hand side once per validator class."""
+        super().__init_subclass__(**kwargs)
+        # jmespath is only imported once a jmespath validator plugin is defined
+        import jmespath  # pylint: disable=import-outside-toplevel
+
+        left = getattr(cls, "left", None)
+        cls._compiled_left = jmespath.compile(left) if isinstance(left, str) else left
+        # Check rhs for compiled jmespath expression
+        right = getattr(cls, "right", None)
+        cls._compiled_right = right if isinstance(right, jmespath.parser.ParsedResult) else None
+        # Convert a literal rhs of numeric comparisons once, errors are reported when validating
+        cls._int_right = None
+        if cls._compiled_right is None and getattr(cls, "operator", None) in _INT_OPERATORS:
+            try:
+                cls._int_right = int(right)
+            except (TypeError, ValueError):
+                pass
+
+    def validate(self, data: dict, strict: bool) -> Iterator[ValidationResult]:  # pylint: disable=W0613
         """Validate data using custom jmespath validator plugin."""
-        operators = {
-            "gt": lambda r, v: int(r) > int(v),
-            "gte": lambda r, v: int(r) >= int(v),
-            "eq": lambda r, v: r == v,
-            "lt": lambda r, v: int(r) < int(v),
-            "lte": lambda r, v: int(r) <= int(v),
-            "contains": lambda r, v: v in r,
-        }
-        lhs = jmespath.search(self.left, data)
+        lhs = self._compiled_left.search(data)
         valid = True
         if lhs:
-            # Check rhs for compiled jmespath expression
-            if isinstance(self.right, jmespath.parser.ParsedResult):
-                rhs = self.right.search(data)
+            if self._compiled_right is not None:
+                rhs = self._compiled_right.search(data)
+            elif self._int_right is not None:
+                rhs = self._int_right
             else:
                 rhs = self.right
-            valid = operators[self.operator](lhs, rhs)
+
+            compare = _INT_OPERATORS.get(self.operator)
+            if compare is None:
+                valid = _OPERATORS[self.operator](lhs, rhs)
+            elif isinstance(lhs, int) and isinstance(rhs, int):
+                valid = compare(lhs, rhs)
+            else:
+                valid = compare(int(lhs), int(rhs))
         if not valid:
-            self.add_validation_error(self.error)
+            yield self.validation_error(self.error)
+        else:
+            yield self.validation_pass()
 
 
 def is_validator(obj) -> bool:
@@ -92,19 +167,59 @@ def is_validator(obj) -> bool:
         return False
 
 
+# Validator plugins imported from each validator directory, with the signature of the modules they were imported from
+_VALIDATORS_CACHE: dict[str, tuple] = {}
+
+
 def load_validators(validator_path: str) -> dict[str, BaseValidation]:
-    """Load all validator plugins from validator_path."""
-    validators = {}
-    for importer, module_name, _ in pkgutil.iter_modules([validator_path]):
-        module = importer.find_module(module_name).load_module(module_name)
+    """Load all validator plugins from validator_path.
+
+    Plugins are only imported again when a module of validator_path was added, removed or modified since the previous
+    call.
+    """
+    # Relative paths are resolved from the current directory, which may change between calls
+    cache_key = os.path.abspath(validator_path)
+    signature = _get_modules_signature(validator_path)
+    cached = _VALIDATORS_CACHE.get(cache_key)
+    if cached is None or cached[0] != signature:
+        cached = _VALIDATORS_CACHE[cache_key] = (signature, _load_validators(validator_path))
+
+    return dict(cached[1])
+
+
+def _get_modules_signature(validator_path: str) -> tuple | None:
+    """Return the name and modification time of the Python modules in validator_path.
+
+    The directory itself and its __pycache__ are ignored, as importing the modules writes to them.
+    """
+    try:
+        with os.scandir(validator_path) as entries:
+            return tuple(sorted((entry.name, entry.stat().st_mtime) for entry in entries if entry.name.endswith(".py")))
+    except OSError:
+        return None
+
+
+def _load_validators(validator_path: str) -> dict[str, BaseValidation]:
+    """Import validator plugins from validator_path."""
+    validator_classes = {}
+    duplicates = []
+    for finder, module_name, _ in pkgutil.iter_modules([validator_path]):
+        spec = finder.find_spec(module_name)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
         for name, cls in inspect.getmembers(module, is_validator):
-            # Default to class name if id doesn't exist
-            if not hasattr(cls, "id"):
+            # Default to class name if the class doesn't define an id
+            if "id" not in cls.__dict__:
                 cls.id = name
-            if cls.id in validators:
-                print(
+            if cls.id in validator_classes:
+                duplicates.append(
                     f"Unable to load the validator {cls.id}, there is already a validator with the same name ({name})."
                 )
             else:
-                validators[cls.id] = cls()
-    return validators
+                validator_classes[cls.id] = cls
+
+    if duplicates:
+        print("\n".join(duplicates))
+
+    return {validator_id: cls() for validator_id, cls in validator_classes.items()}
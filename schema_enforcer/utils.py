@@ -2,27 +2,51 @@
 import os
 import json
 import glob
+import hashlib
+import math
 from collections.abc import Mapping, Sequence
 import importlib
 
 from ruamel.yaml import YAML
+from ruamel.yaml.comments import TaggedScalar
+from ruamel.yaml.constructor import SafeConstructor
+from ruamel.yaml.nodes import MappingNode, SequenceNode
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString as DQ
-from jsonschema import (  # pylint: disable=no-name-in-module
-    RefResolver,
-    Draft7Validator,
-    draft7_format_checker,
-)
 
 from termcolor import colored
 
 
 from click import Option, UsageError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 YAML_HANDLER = YAML()
 YAML_HANDLER.indent(sequence=4, offset=2)
 YAML_HANDLER.explicit_start = True
 
 
+class DataConstructor(SafeConstructor):  # pylint: disable=too-many-ancestors
+    """Safe constructor loading values with an unknown tag (e.g. Ansible's !vault) as the round-trip loader does."""
+
+    def construct_undefined(self, node):
+        """Construct a TaggedScalar for scalars, and a plain list or dict for sequences and mappings."""
+        if isinstance(node, SequenceNode):
+            return self.construct_yaml_seq(node)
+        if isinstance(node, MappingNode):
+            return self.construct_yaml_map(node)
+        return TaggedScalar(value=self.construct_scalar(node), style=node.style, tag=node.tag)
+
+
+DataConstructor.add_constructor(None, DataConstructor.construct_undefined)
+
+# Data is only read, not written back, so it's loaded with the safe loader which uses libyaml when it's available
+YAML_LOADER = YAML(typ="safe")
+YAML_LOADER.Constructor = DataConstructor
+
+
 def warn(msg):
     """Print warning message in yellow."""
     print(colored("WARNING |", "yellow"), msg)
@@ -159,6 +183,13 @@ def load_schema_from_json_file(schema_root_dir, schema_filepath):
         >>> {...}
         >>>
     """
+    # jsonschema is only imported when needed as it noticeably slows down the start of the CLI
+    from jsonschema import (  # pylint: disable=no-name-in-module,import-outside-toplevel
+        RefResolver,
+        Draft7Validator,
+        draft7_format_checker,
+    )
+
     base_uri = f"file:{schema_root_dir}/".replace("\\", "/")
     with open(os.path.join(schema_root_dir, schema_filepath), encoding="utf-8") as fileh:
         schema_definition = json.load(fileh)
@@ -380,13 +411,77 @@ def load_file(filename, file_type=None):
     if filename.startswith("file:///"):
         filename = filename.replace("file://", "")
 
-    handler = YAML_HANDLER if file_type == "yaml" else json
+    if file_type == "json" and orjson:
+        with open(filename, "rb") as fileh:
+            content = fileh.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN or integers above 64 bits), let json parse it or report the error
+            return json.loads(content)
+
+    handler = YAML_LOADER if file_type == "yaml" else json
     with open(filename, "r", encoding="utf-8") as fileh:
         file_data = handler.load(fileh)
 
     return file_data
 
 
+def _is_json_data(data, default=None):
+    """Check data only holds JSON types, which serialize to JSON without being mistaken for another value.
+
+    Subclasses of str, int, dict and list (e.g. Ansible's AnsibleUnicode) are accepted, they are validated as their base
+    type. Other objects, such as dates or tuples written as strings or arrays, and NaN or infinite floats, are rejected.
+
+    Args:
+        data (Any): Structured data to check.
+        default (callable, optional): Function returning a serializable version of other objects, or raising a TypeError.
+
+    Returns:
+        bool: True if data can be serialized without losing information.
+    """
+    if isinstance(data, dict):
+        return all(isinstance(key, str) and _is_json_data(value, default) for key, value in data.items())
+    if isinstance(data, list):
+        return all(_is_json_data(item, default) for item in data)
+    if isinstance(data, float):
+        return math.isfinite(data)
+    if data is None or isinstance(data, (str, int)):
+        return True
+    if default is None:
+        return False
+
+    try:
+        return _is_json_data(default(data), default)
+    except TypeError:
+        return False
+
+
+def get_data_digest(data, default=None):
+    """Compute a digest of structured data, identical for any data with the same content regardless of key order.
+
+    Args:
+        data (dict, list): Structured data, as loaded from a YAML or JSON file or an Ansible inventory.
+        default (callable, optional): Function returning a serializable version of objects JSON doesn't support,
+            or raising a TypeError. Defaults to None.
+
+    Returns:
+        bytes: digest of the data, or None if the data can't be serialized to JSON without losing information.
+    """
+    try:
+        if not _is_json_data(data, default):
+            return None
+        if orjson:
+            # Keys are all strings at this point, the option is only needed for subclasses such as AnsibleUnicode
+            content = orjson.dumps(data, default=default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            content = json.dumps(data, default=default, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError, RecursionError):
+        return None
+
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
 def load_data(file_extensions, search_directories, excluded_filenames, file_type=None, data_key=None):
     """Walk a directory and load all files matching file_extension except the excluded_filenames.
 
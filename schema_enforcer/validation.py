@@ -1,4 +1,5 @@
 """Validation related classes."""
+import sys
 from typing import List, Optional, Any
 from pydantic import BaseModel, validator  # pylint: disable=no-name-in-module
 from termcolor import colored
@@ -6,6 +7,13 @@ from termcolor import colored
 RESULT_PASS = "PASS"  # nosec
 RESULT_FAIL = "FAIL"
 
+# Colored result tags are built once instead of for every result printed
+_PASS_TAG = colored(RESULT_PASS, "green")
+_FAIL_TAG = colored(RESULT_FAIL, "red")
+
+# Results hold the canonical PASS and FAIL strings, instead of a copy made when validating each of them
+_RESULTS = {RESULT_PASS: RESULT_PASS, RESULT_FAIL: RESULT_FAIL}
+
 
 class ValidationResult(BaseModel):
     """ValidationResult object.
@@ -30,9 +38,15 @@ class ValidationResult(BaseModel):
     @validator("result")
     def result_must_be_pass_or_fail(cls, var):  # pylint: disable=no-self-argument, no-self-use
         """Validate that result either PASS or FAIL."""
-        if var.upper() not in [RESULT_PASS, RESULT_FAIL]:
+        result = _RESULTS.get(var) or _RESULTS.get(var.upper())
+        if result is None:
             raise ValueError("must be either PASS or FAIL")
-        return var.upper()
+        return result
+
+    @validator("schema_id")
+    def schema_id_interned(cls, var):  # pylint: disable=no-self-argument, no-self-use
+        """Share a single copy of each schema ID between all results."""
+        return sys.intern(str(var))
 
     def passed(self):
         """Return True or False to indicate if the test has passed.
@@ -40,10 +54,7 @@ class ValidationResult(BaseModel):
         Returns
             Bool: indicate if the test passed or failed
         """
-        if self.result == RESULT_PASS:
-            return True
-
-        return False
+        return self.result == RESULT_PASS
 
     def print(self):
         """Print the result of the test in CLI."""
@@ -55,7 +66,7 @@ class ValidationResult(BaseModel):
     def print_failed(self):
         """Print the result of the test to CLI when the test failed."""
         # Construct the message dynamically based on the instance_type
-        msg = colored("FAIL", "red") + f" | [ERROR] {self.message}"
+        msg = f"{_FAIL_TAG} | [ERROR] {self.message}"
         if self.instance_type == "FILE":
             msg += f" [{self.instance_type}] {self.instance_location}/{self.instance_name}"
 
@@ -70,10 +81,7 @@ class ValidationResult(BaseModel):
     def print_passed(self):
         """Print the result of the test to CLI when the test passed."""
         if self.instance_type == "FILE":
-            print(colored("PASS", "green") + f" | [{self.instance_type}] {self.instance_location}/{self.instance_name}")
+            print(f"{_PASS_TAG} | [{self.instance_type}] {self.instance_location}/{self.instance_name}")
 
-        if self.instance_type == "HOST":
-            print(
-                colored("PASS", "green")
-                + f" | [{self.instance_type}] {self.instance_hostname} [SCHEMA ID] {self.schema_id}"
-            )
+        elif self.instance_type == "HOST":
+            print(f"{_PASS_TAG} | [{self.instance_type}] {self.instance_hostname} [SCHEMA ID] {self.schema_id}")
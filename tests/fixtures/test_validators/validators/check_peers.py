@@ -28,7 +28,7 @@ class CheckPeers(BaseValidation):  # pylint: disable=too-few-public-methods
                     continue
                 peer = int_cfg["peer"]
                 if "peer_int" not in int_cfg:
-                    self.add_validation_error("Peer interface is not defined")
+                    yield self.validation_error("Peer interface is not defined")
                     continue
                 peer_int = int_cfg["peer_int"]
                 peer = ansible_hostname(peer)
@@ -37,6 +37,6 @@ class CheckPeers(BaseValidation):  # pylint: disable=too-few-public-methods
                 peer_match = data[peer]["interfaces"][peer_int]["peer"] == normal_hostname(host)
                 peer_int_match = data[peer]["interfaces"][peer_int]["peer_int"] == interface
                 if peer_match and peer_int_match:
-                    self.add_validation_pass()
+                    yield self.validation_pass()
                 else:
-                    self.add_validation_error("Peer information does not match.")
+                    yield self.validation_error("Peer information does not match.")
@@ -4,6 +4,7 @@
 import pytest
 
 from schema_enforcer.ansible_inventory import AnsibleInventory
+from schema_enforcer.utils import get_data_digest
 
 
 INVENTORY_DIR = "tests/mocks/inventory"
@@ -99,3 +100,20 @@ def test_get_clean_host_vars(ansible_inv):
     host3.set_variable("magic_vars_to_evaluate", "inventory_hostname")
     with pytest.raises(TypeError):
         host3_cleaned_vars = ansible_inv.get_clean_host_vars(host3)
+
+
+def test_get_clean_host_vars_rendered(ansible_inv):
+    host3 = ansible_inv.inv_mgr.get_host("host3")
+    host3_vars = ansible_inv.get_host_vars(host3)
+    host3_cleaned_vars = ansible_inv.get_clean_host_vars(host3, host3_vars)
+    assert host3_cleaned_vars == ansible_inv.get_clean_host_vars(host3)
+    assert "inventory_hostname" in host3_vars
+    assert ansible_inv.get_schema_validation_settings(host3, host3_vars) == ansible_inv.get_schema_validation_settings(
+        host3
+    )
+
+
+def test_get_clean_host_vars_digest(ansible_inv):
+    """Test that the variables of a host can be hashed to reuse validation results across hosts."""
+    host3 = ansible_inv.inv_mgr.get_host("host3")
+    assert get_data_digest(ansible_inv.get_clean_host_vars(host3)) is not None
@@ -1,7 +1,17 @@
 """Unit tests for cli.py when ansible is installed"""
+import datetime
+import os
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
 from click.testing import CliRunner
 
 from schema_enforcer import cli
+from schema_enforcer.schemas.jsonschema import JsonSchema
+from schema_enforcer.schemas.validator import BaseValidation
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fixtures")
 
 
 def test_ansible_import_when_exists():
@@ -14,3 +24,63 @@ def test_ansible_import_when_exists():
     assert str(raised_error.exception) == str(SystemExit(1))
     assert raised_error.exit_code == 1
     assert raised_error.output == "\x1b[31m  ERROR |\x1b[0m No schemas were loaded\n"
+
+
+@pytest.mark.parametrize("jobs", ["2", "0"])
+def test_ansible_jobs(monkeypatch, jobs):
+    """Tests validating hosts across worker processes gives the same output as a single process."""
+    monkeypatch.chdir(os.path.join(FIXTURES_DIR, "test_validators"))
+    runner = CliRunner()
+    expected = runner.invoke(cli.ansible, ["--inventory", "inventory", "--show-pass"])
+    result = runner.invoke(cli.ansible, ["--inventory", "inventory", "--show-pass", "--jobs", jobs])
+    assert result.exit_code == expected.exit_code == 1
+    assert result.output == expected.output
+    assert "[HOST] az_phx_pe02" in result.output
+
+
+def test_validate_host_results_cache():
+    """Tests hosts with values JSON can't tell apart, like a date and a string, don't share validation results."""
+    schema = JsonSchema(
+        schema={"$id": "schemas/build", "type": "object", "properties": {"build_date": {"type": "string"}}},
+        filename="build.yml",
+        root=FIXTURES_DIR,
+    )
+    smgr = SimpleNamespace(schemas={"schemas/build": schema})
+    cache = OrderedDict()
+    results = cli._validate_host(  # pylint: disable=protected-access
+        {"build_date": "2021-01-01"}, ("schemas/build",), False, smgr, cache
+    )
+    assert results[0].passed()
+    results = cli._validate_host(  # pylint: disable=protected-access
+        {"build_date": datetime.date(2021, 1, 1)}, ("schemas/build",), False, smgr, cache
+    )
+    assert not results[0].passed()
+
+
+def test_validate_host_implicit_pass():
+    """Tests a custom validator yielding no result for a host is reported as a pass."""
+
+    class CheckNothing(BaseValidation):  # pylint: disable=too-few-public-methods
+        id = "CheckNothing"
+        top_level_properties = ["interfaces"]
+
+        def validate(self, data: dict, strict: bool):
+            yield from ()
+
+    smgr = SimpleNamespace(schemas={"CheckNothing": CheckNothing()})
+    results = cli._validate_host(  # pylint: disable=protected-access
+        {"interfaces": {}}, ("CheckNothing",), False, smgr, OrderedDict()
+    )
+    assert len(results) == 1
+    assert results[0].passed()
+    assert results[0].schema_id == "CheckNothing"
+
+
+def test_ansible_jobs_single_host(monkeypatch):
+    """Tests a single host is validated without starting worker processes, whatever the number of jobs."""
+    monkeypatch.chdir(os.path.join(FIXTURES_DIR, "test_validators"))
+    monkeypatch.setattr(cli, "ProcessPoolExecutor", None)
+    runner = CliRunner()
+    result = runner.invoke(cli.ansible, ["--inventory", "inventory", "--host", "az_phx_pe01", "--show-pass", "-j", "2"])
+    assert result.exit_code == 0
+    assert "[HOST] az_phx_pe01 [SCHEMA ID] CheckInterface" in result.output
@@ -0,0 +1,21 @@
+"""Unit tests for cli.py validate command"""
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from schema_enforcer import cli
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fixtures", "test_instances")
+
+
+@pytest.mark.parametrize("jobs", ["2", "0"])
+def test_validate_jobs(monkeypatch, jobs):
+    """Tests validating instance files across worker processes gives the same output as a single process."""
+    monkeypatch.chdir(FIXTURES_DIR)
+    runner = CliRunner()
+    expected = runner.invoke(cli.validate, ["--show-pass"])
+    result = runner.invoke(cli.validate, ["--show-pass", "--jobs", jobs])
+    assert result.exit_code == expected.exit_code == 0
+    assert result.output == expected.output
+    assert "ALL SCHEMA VALIDATION CHECKS PASSED" in result.output
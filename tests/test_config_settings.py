@@ -1,7 +1,9 @@
 """ Test Setting Configuration Parameters"""
 import os
+import sys
 
 import pytest
+from pydantic import ValidationError
 from schema_enforcer import config
 
 FIXTURES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fixtures", "test_config")
@@ -62,3 +64,20 @@ def test_load_and_exit_invalid_data():
     config_file_name = FIXTURES_DIR + "/pyproject_invalid_attr.toml"
     with pytest.raises(SystemExit):
         config.load_and_exit(config_file_name=config_file_name)
+
+
+def test_load_invalid_validation_backend():
+    """
+    Test config load raises an error when the validation backend is not supported
+    """
+    with pytest.raises(ValidationError):
+        config.load(config_data={"validation_backend": "not_a_backend"})
+
+
+def test_load_validation_backend_not_installed(monkeypatch):
+    """
+    Test config load raises an error with an install hint when the validation backend is not installed
+    """
+    monkeypatch.setitem(sys.modules, "fastjsonschema", None)
+    with pytest.raises(ValidationError, match=r"pip install schema-enforcer\[fastjsonschema\]"):
+        config.load(config_data={"validation_backend": "fastjsonschema"})
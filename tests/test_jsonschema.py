@@ -1,8 +1,12 @@
 # pylint: disable=redefined-outer-name
 """Tests to validate functions defined in jsonschema.py"""
 import os
+from collections import OrderedDict
+
+import jsonref
 import pytest
 
+from schema_enforcer.schemas import jsonschema
 from schema_enforcer.schemas.jsonschema import JsonSchema
 from schema_enforcer.validation import RESULT_PASS, RESULT_FAIL
 from schema_enforcer.utils import load_file
@@ -72,36 +76,64 @@ class TestJsonSchema:
         Args:
             schema_instance (JsonSchema): Instance of JsonSchema class
         """
-        schema_instance.validate(data=valid_instance_data)
-        validation_results = schema_instance.get_results()
+        validation_results = list(schema_instance.validate(data=valid_instance_data))
         assert len(validation_results) == 1
         assert validation_results[0].schema_id == LOADED_SCHEMA_DATA.get("$id")
         assert validation_results[0].result == RESULT_PASS
         assert validation_results[0].message is None
-        schema_instance.clear_results()
 
-        schema_instance.validate(data=invalid_instance_data)
-        validation_results = schema_instance.get_results()
+        validation_results = list(schema_instance.validate(data=invalid_instance_data))
         assert len(validation_results) == 1
         assert validation_results[0].schema_id == LOADED_SCHEMA_DATA.get("$id")
         assert validation_results[0].result == RESULT_FAIL
         assert validation_results[0].message == "True is not of type 'string'"
         assert validation_results[0].absolute_path == ["dns_servers", "0", "address"]
-        schema_instance.clear_results()
 
-        schema_instance.validate(data=strict_invalid_instance_data, strict=False)
-        validation_results = schema_instance.get_results()
+        validation_results = list(schema_instance.validate(data=strict_invalid_instance_data, strict=False))
         assert validation_results[0].result == RESULT_PASS
-        schema_instance.clear_results()
 
-        schema_instance.validate(data=strict_invalid_instance_data, strict=True)
-        validation_results = schema_instance.get_results()
+        validation_results = list(schema_instance.validate(data=strict_invalid_instance_data, strict=True))
         assert validation_results[0].result == RESULT_FAIL
         assert (
             validation_results[0].message
             == "Additional properties are not allowed ('fun_extr_attribute' was unexpected)"
         )
-        schema_instance.clear_results()
+
+    @staticmethod
+    def test_validate_fastjsonschema(valid_instance_data, invalid_instance_data, strict_invalid_instance_data):
+        """Tests validate method of JsonSchema class with the fastjsonschema backend"""
+        schema_data = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "schemas/dns_servers",
+            "type": "object",
+            "properties": {
+                "dns_servers": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"address": {"type": "string", "format": "ipv4"}, "vrf": {"type": "string"}},
+                        "required": ["address"],
+                    },
+                }
+            },
+            "required": ["dns_servers"],
+        }
+        schema_instance = JsonSchema(
+            schema=schema_data, filename="dns.yml", root=FIXTURES_DIR, backend="fastjsonschema"
+        )
+
+        validation_results = list(schema_instance.validate(data=valid_instance_data))
+        assert len(validation_results) == 1
+        assert validation_results[0].result == RESULT_PASS
+
+        validation_results = list(schema_instance.validate(data=invalid_instance_data))
+        assert len(validation_results) == 1
+        assert validation_results[0].result == RESULT_FAIL
+        assert validation_results[0].message == "data.dns_servers[0].address must be string"
+        assert validation_results[0].absolute_path == ["dns_servers", "0", "address"]
+
+        validation_results = list(schema_instance.validate(data=strict_invalid_instance_data, strict=True))
+        assert validation_results[0].result == RESULT_FAIL
 
     @staticmethod
     def test_format_checkers(schema_instance, data_instance, expected_error_message):
@@ -124,8 +156,52 @@ class TestJsonSchema:
         assert validation_results_dicts[0]["result"] == RESULT_PASS
 
     @staticmethod
-    def test_get_validator():
-        pass
+    def test_get_validator(schema_instance, valid_instance_data):
+        """Tests identical schemas share the same compiled validator.
+
+        Args:
+            schema_instance (JsonSchema): Instance of JsonSchema class
+        """
+        other_instance = JsonSchema(
+            schema=LOADED_SCHEMA_DATA,
+            filename="dns.yml",
+            root=os.path.join(FIXTURES_DIR, "schema", "schemas"),
+        )
+        list(schema_instance.validate(data=valid_instance_data))
+        list(other_instance.validate(data=valid_instance_data))
+        assert schema_instance.validator is not None
+        assert schema_instance.validator is other_instance.validator
+
+    @staticmethod
+    def test_get_validator_resolved_refs(valid_instance_data):
+        """Tests schemas with identical references resolving to different definitions don't share a validator."""
+        schemas = [
+            jsonref.JsonRef.replace_refs(
+                {"$id": "schemas/dns_servers", "properties": {"dns_servers": {"$ref": "definitions.json"}}},
+                loader=lambda uri, definition=definition: definition,
+            )
+            for definition in ({"type": "array"}, {"type": "string"})
+        ]
+        instances = [JsonSchema(schema=schema, filename="dns.yml", root=FIXTURES_DIR) for schema in schemas]
+        assert list(instances[0].validate(data=valid_instance_data))[0].result == RESULT_PASS
+        assert list(instances[1].validate(data=valid_instance_data))[0].result == RESULT_FAIL
+        assert instances[0].validator is not instances[1].validator
+
+    @staticmethod
+    def test_get_cached_validator_bounded(monkeypatch):
+        """Tests the least recently used validators are dropped when the validator cache is full."""
+        monkeypatch.setattr(jsonschema, "VALIDATOR_CACHE_SIZE", 2)
+        monkeypatch.setattr(jsonschema, "_VALIDATOR_CACHE", OrderedDict())
+        schemas = [{"type": schema_type} for schema_type in ("array", "string", "integer")]
+        format_checker = jsonschema.draft7_format_checker
+
+        array_validator = jsonschema.get_cached_validator(schemas[0], format_checker)
+        string_validator = jsonschema.get_cached_validator(schemas[1], format_checker)
+        assert jsonschema.get_cached_validator(schemas[0], format_checker) is array_validator
+        jsonschema.get_cached_validator(schemas[2], format_checker)
+        assert len(jsonschema._VALIDATOR_CACHE) == 2  # pylint: disable=protected-access
+        assert jsonschema.get_cached_validator(schemas[0], format_checker) is array_validator
+        assert jsonschema.get_cached_validator(schemas[1], format_checker) is not string_validator
 
     @staticmethod
     def test_get_strict_validator():
@@ -75,11 +75,15 @@ def test_generate_invalid(capsys):
             generated = gen_file.read()
         assert expected == generated
 
-    test_schema = schema_manager.schemas.get(schema_id)
-    # Clear results as these would not be carried over into subsequent run of --check
-    test_schema.clear_results()
     # Ignore earlier output
     capsys.readouterr()
     schema_manager.test_schemas()
     captured = capsys.readouterr()
     assert "ALL SCHEMAS ARE VALID" in captured.out
+
+
+def test_get_schema_ids_by_property(schema_manager):
+    """Test schema IDs are indexed by the top level properties of the schemas."""
+    assert schema_manager.get_schema_ids_by_property("dns_servers") == ["schemas/dns_servers"]
+    assert schema_manager.get_schema_ids_by_property("ntp_servers") == ["schemas/ntp"]
+    assert schema_manager.get_schema_ids_by_property("not_a_property") == []
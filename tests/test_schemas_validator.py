@@ -1,8 +1,11 @@
 """Tests for validator plugin support."""
 # pylint: disable=redefined-outer-name
 import os
+import shutil
+import sys
 import pytest
 from schema_enforcer.ansible_inventory import AnsibleInventory
+from schema_enforcer.exceptions import InvalidValidatorPlugin
 import schema_enforcer.schemas.validator as v
 
 FIXTURE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fixtures", "test_validators")
@@ -46,10 +49,8 @@ def test_jmespathvalidation_pass(host_vars, validators):
               type: "core"
     """
     validator = validators["CheckInterface"]
-    validator.validate(host_vars["az_phx_pe01"], False)
-    result = validator.get_results()
+    result = list(validator.validate(host_vars["az_phx_pe01"], False))
     assert result[0].passed()
-    validator.clear_results()
 
 
 def test_jmespathvalidation_fail(host_vars, validators):
@@ -63,10 +64,8 @@ def test_jmespathvalidation_fail(host_vars, validators):
               type: "access"
     """
     validator = validators["CheckInterface"]
-    validator.validate(host_vars["az_phx_pe02"], False)
-    result = validator.get_results()
+    result = list(validator.validate(host_vars["az_phx_pe02"], False))
     assert not result[0].passed()
-    validator.clear_results()
 
 
 def test_jmespathvalidation_with_compile_pass(host_vars, validators):
@@ -87,10 +86,8 @@ def test_jmespathvalidation_with_compile_pass(host_vars, validators):
           type: "core"
     """
     validator = validators["CheckInterfaceIPv4"]
-    validator.validate(host_vars["az_phx_pe01"], False)
-    result = validator.get_results()
+    result = list(validator.validate(host_vars["az_phx_pe01"], False))
     assert result[0].passed()
-    validator.clear_results()
 
 
 def test_jmespathvalidation_with_compile_fail(host_vars, validators):
@@ -104,10 +101,8 @@ def test_jmespathvalidation_with_compile_fail(host_vars, validators):
           type: "core"
     """
     validator = validators["CheckInterfaceIPv4"]
-    validator.validate(host_vars["co_den_p01"], False)
-    result = validator.get_results()
+    result = list(validator.validate(host_vars["co_den_p01"], False))
     assert not result[0].passed()
-    validator.clear_results()
 
 
 def test_modelvalidation_pass(host_vars, validators):
@@ -126,11 +121,9 @@ def test_modelvalidation_pass(host_vars, validators):
         peer_int: "GigabitEthernet0/0/0/0"
     """
     validator = validators["CheckPeers"]
-    validator.validate(host_vars, False)
-    result = validator.get_results()
+    result = list(validator.validate(host_vars, False))
     assert result[0].passed()
     assert result[2].passed()
-    validator.clear_results()
 
 
 def test_modelvalidation_fail(host_vars, validators):
@@ -150,6 +143,122 @@ def test_modelvalidation_fail(host_vars, validators):
         peer_int: GigabitEthernet0/0/0/2
     """
     validator = validators["CheckPeers"]
-    validator.validate(host_vars, False)
-    result = validator.get_results()
+    result = list(validator.validate(host_vars, False))
     assert not result[1].passed()
+
+
+def test_load_validators_cached(tmp_path, monkeypatch):
+    """Test that validators are only imported once while the modules of the validator directory are unchanged."""
+    # Importing the plugins writes their bytecode next to them, which must not invalidate the cache
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    validator_path = str(tmp_path / "validators")
+    shutil.copytree(os.path.join(FIXTURE_DIR, "validators"), validator_path)
+
+    first = v.load_validators(validator_path)
+    second = v.load_validators(validator_path)
+    assert os.path.isdir(os.path.join(validator_path, "__pycache__"))
+    assert first is not second
+    assert set(first) == {"CheckInterface", "CheckInterfaceIPv4", "CheckPeers"}
+    assert all(first[validator_id] is second[validator_id] for validator_id in first)
+
+    # Modifying a module imports the plugins again
+    module_path = os.path.join(validator_path, "check_peers.py")
+    mtime = os.path.getmtime(module_path) + 10
+    os.utime(module_path, (mtime, mtime))
+    third = v.load_validators(validator_path)
+    assert set(third) == set(first)
+    assert third["CheckPeers"] is not first["CheckPeers"]
+
+
+def test_load_validators_subclass_id(tmp_path):
+    """Test that a validator subclassing another one is registered under its own id rather than its parent's."""
+    validator_path = tmp_path / "validators"
+    validator_path.mkdir()
+    (validator_path / "check_mtu.py").write_text(
+        "from schema_enforcer.schemas.validator import JmesPathModelValidation\n\n\n"
+        "class CheckMtu(JmesPathModelValidation):\n"
+        "    id = 'CheckMtuId'\n"
+        "    top_level_properties = ['mtu']\n"
+        "    left = 'mtu'\n"
+        "    right = 1500\n"
+        "    operator = 'gte'\n"
+        "    error = 'MTU is too small'\n\n\n"
+        "class CheckJumboMtu(CheckMtu):\n"
+        "    right = 9000\n",
+        encoding="utf-8",
+    )
+
+    validators = v.load_validators(str(validator_path))
+    assert set(validators) == {"CheckMtuId", "CheckJumboMtu"}
+    assert validators["CheckJumboMtu"].id == "CheckJumboMtu"
+    assert not list(validators["CheckJumboMtu"].validate({"mtu": 1500}, False))[0].passed()
+
+
+def test_jmespathvalidation_int_coercion():
+    """Test that numeric operators compare values as integers, whether or not they are already integers."""
+
+    class CheckMtu(v.JmesPathModelValidation):  # pylint: disable=too-few-public-methods
+        id = "CheckMtu"
+        top_level_properties = ["mtu"]
+        left = "mtu"
+        right = "1500"
+        operator = "gte"
+        error = "MTU is too small"
+
+    validator = CheckMtu()
+    assert list(validator.validate({"mtu": 9000}, False))[0].passed()
+    assert list(validator.validate({"mtu": "9000"}, False))[0].passed()
+    assert not list(validator.validate({"mtu": 1400}, False))[0].passed()
+
+
+def test_validator_slots():
+    """Test that validators declaring __slots__ are created without a __dict__."""
+
+    class CheckSlots(v.BaseValidation):  # pylint: disable=too-few-public-methods
+        __slots__ = ()
+        id = "CheckSlots"
+
+        def validate(self, data: dict, strict: bool):
+            yield self.validation_pass()
+
+    validator = CheckSlots()
+    assert not hasattr(validator, "__dict__")
+    assert list(validator.validate({}, False))[0].passed()
+
+
+def test_iter_results_implicit_pass(validators):
+    """Test that a pass is reported when a validator yields no result, e.g. CheckPeers on hosts without peers."""
+    validator = validators["CheckPeers"]
+    data = {"az_phx_pe01": {"interfaces": {"GigabitEthernet0/0/0/0": {"type": "access"}}}}
+    assert not list(validator.validate(data, False))
+    results = list(validator.iter_results(data, False))
+    assert len(results) == 1
+    assert results[0].passed()
+    assert results[0].schema_id == "CheckPeers"
+
+
+def test_iter_results_legacy_plugin():
+    """Test that plugins written for the removed validator API fail with an error pointing to the documentation."""
+
+    class CheckLegacyReturn(v.BaseValidation):  # pylint: disable=too-few-public-methods
+        id = "CheckLegacyReturn"
+
+        def validate(self, data: dict, strict: bool):
+            pass
+
+    class CheckLegacyAdd(v.BaseValidation):  # pylint: disable=too-few-public-methods
+        id = "CheckLegacyAdd"
+
+        def validate(self, data: dict, strict: bool):
+            self.add_validation_error("Legacy error")
+
+    with pytest.raises(
+        InvalidValidatorPlugin, match="CheckLegacyReturn returned NoneType .* docs/custom_validators.md"
+    ):
+        list(CheckLegacyReturn().iter_results({}, False))
+    with pytest.raises(
+        InvalidValidatorPlugin, match=r"CheckLegacyAdd uses add_validation_error, .* self.validation_error"
+    ):
+        list(CheckLegacyAdd().iter_results({}, False))
+    with pytest.raises(AttributeError):
+        CheckLegacyAdd().not_an_attribute  # pylint: disable=expression-not-assigned
@@ -1,5 +1,6 @@
 """Tests to validate functions defined in utils.py"""
 
+import datetime
 import os
 import json
 import shutil
@@ -168,3 +169,45 @@ def test_dump_schema_vars():
 
     shutil.rmtree(output_dir)
     assert not os.path.isdir(output_dir)
+
+
+def test_get_data_digest():
+    digest = utils.get_data_digest({"dns_servers": [{"address": "10.1.1.1", "vrf": "mgmt"}]})
+    assert digest == utils.get_data_digest({"dns_servers": [{"vrf": "mgmt", "address": "10.1.1.1"}]})
+    assert digest != utils.get_data_digest({"dns_servers": [{"address": "10.1.1.2", "vrf": "mgmt"}]})
+    assert utils.get_data_digest({"vlans": {10: "mgmt"}}) is None
+
+    # Values which JSON would write like another value can't be told apart by a digest
+    assert utils.get_data_digest({"build_date": datetime.date(2021, 1, 1)}) is None
+    assert utils.get_data_digest({"build_date": "2021-01-01"}) is not None
+    assert utils.get_data_digest({"servers": ("10.1.1.1",)}) is None
+    assert utils.get_data_digest({"servers": ["10.1.1.1"]}) is not None
+    assert utils.get_data_digest({"mtu": float("nan")}) is None
+
+
+def test_get_data_digest_without_orjson(monkeypatch):
+    monkeypatch.setattr(utils, "orjson", None)
+    digest = utils.get_data_digest({"dns_servers": [{"address": "10.1.1.1", "vrf": "mgmt"}]})
+    assert digest == utils.get_data_digest({"dns_servers": [{"vrf": "mgmt", "address": "10.1.1.1"}]})
+    assert digest != utils.get_data_digest({"dns_servers": [{"address": "10.1.1.2", "vrf": "mgmt"}]})
+    assert utils.get_data_digest({"build_date": datetime.date(2021, 1, 1)}) is None
+
+
+def test_load_file_unknown_tags(tmp_path):
+    data_file = tmp_path / "vault.yml"
+    data_file.write_text(
+        "---\npassword: !vault |\n  $ANSIBLE_VAULT;1.1;AES256\n  6162\nservers: !custom\n  - name: 'ntp1'\n",
+        encoding="utf-8",
+    )
+    data = utils.load_file(str(data_file))
+    assert data["password"].tag == "!vault"
+    assert data["password"].value == "$ANSIBLE_VAULT;1.1;AES256\n6162\n"
+    assert data["servers"] == [{"name": "ntp1"}]
+
+
+def test_load_file_json_fallback(tmp_path):
+    data_file = tmp_path / "data.json"
+    data_file.write_text('{"mtu": NaN, "asn": 123456789012345678901234567890}', encoding="utf-8")
+    data = utils.load_file(str(data_file))
+    assert data["mtu"] != data["mtu"]
+    assert data["asn"] == 123456789012345678901234567890